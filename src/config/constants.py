@@ -2,12 +2,11 @@
 STATUS_UPDATE_DELAY = 2.0
 
 # Minecraft detection constants
-MINECRAFT_EXECUTABLES = ("javaw.exe", "java.exe")
+MINECRAFT_EXECUTABLES = frozenset(("javaw.exe", "java.exe"))
 
 # Keyboard constants
 MINECRAFT_CHAT_KEY = 't'
-ENTER_KEY_DELAY = 0.15
 
 # Message formatting
-DEFAULT_SENTENCE_ENDINGS = (".", "!", "?")
+DEFAULT_SENTENCE_ENDINGS = frozenset((".", "!", "?"))
 
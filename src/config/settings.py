@@ -8,7 +8,8 @@ class AudioSettings:
     """Audio processing configuration."""
     sample_rate: int = 16000
     channels: int = 1
-    dtype: str = 'float32'
+    dtype: str = 'int16'
+    blocksize_ms: int = 20
     whisper_model: str = 'small'
     compute_type: str = 'int8'
     beam_size: int = 3
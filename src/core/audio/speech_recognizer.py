@@ -102,7 +102,12 @@ class SpeechRecognizer:
         try:
             if self._model is None:
                 raise AudioProcessingError("Model is None despite being marked as ready")
-            
+
+            # Capture is int16 to halve the realtime copy bandwidth; the
+            # one-time float conversion happens here, off the audio thread
+            if audio_data.dtype == np.int16:
+                audio_data = audio_data.astype(np.float32) / 32768.0
+
             segments, _ = self._model.transcribe(
                 audio_data, 
                 language='en',
@@ -135,8 +140,9 @@ class SpeechRecognizer:
         # Capitalize first letter
         formatted = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
         
-        # Add punctuation if missing
-        if not formatted.endswith(DEFAULT_SENTENCE_ENDINGS):
+        # Add punctuation if missing (endings are single characters, so a
+        # set membership test on the last one is enough)
+        if formatted[-1] not in DEFAULT_SENTENCE_ENDINGS:
             formatted += "."
             
         return formatted
@@ -1,12 +1,24 @@
+import ctypes
 import logging
-import sounddevice as sd
+import sys
 import numpy as np
 from typing import Optional, Callable
-from threading import Lock
 
 from config.settings import app_settings
 from utils.exceptions import AudioProcessingError
 
+_sd = None
+
+
+def _import_sounddevice():
+    """Import sounddevice on first use; probing PortAudio libraries at
+    module load delays app startup."""
+    global _sd
+    if _sd is None:
+        import sounddevice
+        _sd = sounddevice
+    return _sd
+
 
 class VoiceRecorder:
     """Handles audio recording and buffering."""
@@ -19,13 +31,29 @@ class VoiceRecorder:
         # Pre-allocated buffer optimization
         self._max_recording_duration = 20
         self._max_samples = self._audio_settings.sample_rate * self._max_recording_duration
-        self._audio_buffer = np.zeros(self._max_samples, dtype=np.float32)
-        self._buffer_position = 0
-        
-        self._stream: Optional[sd.InputStream] = None
+        self._buffer_dtype = np.dtype(self._audio_settings.dtype)
+        self._bytes_per_sample = self._buffer_dtype.itemsize
+        self._audio_buffer = self._allocate_audio_buffer()
+
+        # Single-producer (audio callback) / single-consumer (stop_recording)
+        # write cursor. CPython guarantees atomic stores for int attributes,
+        # so the callback can publish progress without taking a lock and
+        # risking priority inversion on the realtime audio thread.
+        self._write_pos = 0
+
+        # Resolved once so the callback avoids per-invocation shape checks
+        self._is_mono = self._audio_settings.channels == 1
+
+        # Fixed blocksize so PortAudio delivers predictable ~20ms chunks
+        # instead of backend-chosen tiny blocks (fewer Python callbacks)
+        self._blocksize = (
+            self._audio_settings.sample_rate * self._audio_settings.blocksize_ms // 1000
+        )
+
+        self._stream = None
         self._is_recording = False
-        self._stream_active = False 
-        self._buffer_lock = Lock()
+        self._stream_active = False
+        self._overflow_flag = False
         
     def start_recording(self) -> None:
         """Start audio recording."""
@@ -37,16 +65,25 @@ class VoiceRecorder:
             self._cleanup_stream()
             
         try:
-            # Reset buffer position
-            self._buffer_position = 0
+            sd = _import_sounddevice()
+
+            # Allocate a fresh buffer instead of recycling the old one, so
+            # the view returned by the previous stop_recording stays valid
+            # for the STT consumer while the new recording fills this one.
+            self._unlock_buffer_pages(self._audio_buffer)
+            self._audio_buffer = self._allocate_audio_buffer()
+            self._write_pos = 0
+            self._overflow_flag = False
             self._is_recording = True
             self._stream_active = True
-            
+
             self._stream = sd.InputStream(
                 samplerate=self._audio_settings.sample_rate,
                 channels=self._audio_settings.channels,
                 dtype=self._audio_settings.dtype,
-                callback=self._audio_callback
+                blocksize=self._blocksize,
+                callback=self._audio_callback,
+                finished_callback=self._on_stream_finished
             )
             self._stream.start()
             self._logger.info("Recording started")
@@ -58,30 +95,80 @@ class VoiceRecorder:
             raise AudioProcessingError(f"Failed to start recording: {e}")
     
     def stop_recording(self) -> np.ndarray:
-        """Stop audio recording and return recorded audio."""
+        """Stop audio recording and return the recorded audio.
+
+        Returns a read-only view into the recording buffer rather than a
+        copy; start_recording allocates a fresh buffer, so the view is
+        never overwritten by a later recording.
+        """
         was_recording = self._is_recording
         self._is_recording = False
         
         if not was_recording and not self._stream_active:
             self._logger.warning("No recording in progress")
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=self._buffer_dtype)
         
         try:
             self._cleanup_stream()
-                
-            with self._buffer_lock:
-                if self._buffer_position == 0:
-                    raise AudioProcessingError("No audio data captured")
-                
-                # Return only the recorded portion
-                audio_data = self._audio_buffer[:self._buffer_position].copy()
-                
-            self._logger.info(f"Recording stopped: {self._buffer_position} samples captured")
+
+            # Read the producer's cursor once; the stream is stopped so no
+            # further writes can race with the slice below.
+            recorded_samples = self._write_pos
+            if recorded_samples == 0:
+                raise AudioProcessingError("No audio data captured")
+
+            # Return only the recorded portion as a zero-copy view
+            audio_data = self._audio_buffer[:recorded_samples]
+            audio_data.setflags(write=False)
+
+            # Guard so the f-string isn't built when INFO is disabled
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(f"Recording stopped: {recorded_samples} samples captured")
             return audio_data
             
         except Exception as e:
             raise AudioProcessingError(f"Failed to stop recording: {e}")
     
+    def _allocate_audio_buffer(self) -> np.ndarray:
+        """Allocate the recording buffer with its pages already resident.
+
+        The storage is a raw ctypes array so the callback can memmove into
+        it by address; the returned NumPy array is a zero-copy view over the
+        same memory (and keeps the ctypes array alive). Zero-filling touches
+        every page up front so the first realtime callbacks of a recording
+        never stall on minor page faults.
+        """
+        self._raw_buffer = (ctypes.c_char * (self._max_samples * self._bytes_per_sample))()
+        self._buffer_address = ctypes.addressof(self._raw_buffer)
+        buffer = np.frombuffer(self._raw_buffer, dtype=self._buffer_dtype)
+        buffer.fill(0)
+        self._lock_buffer_pages(buffer)
+        return buffer
+
+    def _lock_buffer_pages(self, buffer: np.ndarray) -> None:
+        """Best-effort pin of the buffer pages into physical memory."""
+        if sys.platform != 'win32':
+            return
+        try:
+            ctypes.windll.kernel32.VirtualLock(
+                ctypes.c_void_p(buffer.ctypes.data),
+                ctypes.c_size_t(buffer.nbytes)
+            )
+        except Exception as error:
+            self._logger.debug(f"Could not lock audio buffer pages: {error}")
+
+    def _unlock_buffer_pages(self, buffer: np.ndarray) -> None:
+        """Release a previous page lock; safe to call if locking failed."""
+        if sys.platform != 'win32':
+            return
+        try:
+            ctypes.windll.kernel32.VirtualUnlock(
+                ctypes.c_void_p(buffer.ctypes.data),
+                ctypes.c_size_t(buffer.nbytes)
+            )
+        except Exception as error:
+            self._logger.debug(f"Could not unlock audio buffer pages: {error}")
+
     def _cleanup_stream(self) -> None:
         """Safely cleanup the audio stream."""
         self._stream_active = False
@@ -99,25 +186,52 @@ class VoiceRecorder:
         """Audio stream callback function."""
         if not self._is_recording:
             return
-            
-        with self._buffer_lock:
-            chunk = indata[:, 0] if indata.ndim > 1 else indata.flatten()
-            chunk_size = len(chunk)
-            
-            # Check if we have space
-            if self._buffer_position + chunk_size > self._max_samples:
-                self._logger.warning(f"Recording buffer full ({self._max_recording_duration}s limit reached)")
-                self._is_recording = False  # stop accepting data but stream cleanup happens in stop_recording
-                
-                if self._buffer_full_callback:
-                    self._buffer_full_callback(
-                        f"Recording stopped: {self._max_recording_duration}s buffer limit reached"
-                    )
-                return
-            
-            # Copy directly into pre-allocated buffer
-            self._audio_buffer[self._buffer_position:self._buffer_position + chunk_size] = chunk
-            self._buffer_position += chunk_size
+
+        # Hoist attribute loads used more than once into locals; every
+        # LOAD_ATTR saved counts at callback cadence
+        write_pos = self._write_pos
+        bytes_per_sample = self._bytes_per_sample
+
+        # Clamp to the remaining space so a final chunk that doesn't fully
+        # fit is still partially captured instead of dropped.
+        available = self._max_samples - write_pos
+        copy_size = frames if frames <= available else available
+
+        # Copy into the pre-allocated buffer, then publish the new cursor so
+        # the consumer never observes a position ahead of the written data.
+        if self._is_mono:
+            # The mono (frames, 1) input is C-contiguous, so a raw memmove
+            # is an exact copy and skips NumPy's per-assignment dtype and
+            # stride checking
+            ctypes.memmove(
+                self._buffer_address + write_pos * bytes_per_sample,
+                indata.ctypes.data,
+                copy_size * bytes_per_sample
+            )
+        else:
+            self._audio_buffer[write_pos:write_pos + copy_size] = indata[:copy_size, 0]
+        self._write_pos = write_pos + copy_size
+
+        if copy_size < frames:
+            # Buffer full: just flag it and stop the stream. Logging and the
+            # callback dispatch allocate, so they run in _on_stream_finished
+            # off the realtime thread.
+            self._overflow_flag = True
+            self._is_recording = False
+            raise _sd.CallbackStop
+
+    def _on_stream_finished(self) -> None:
+        """Report buffer overflow; runs off the realtime audio thread."""
+        if not self._overflow_flag:
+            return
+
+        self._overflow_flag = False
+        self._logger.warning(f"Recording buffer full ({self._max_recording_duration}s limit reached)")
+
+        if self._buffer_full_callback:
+            self._buffer_full_callback(
+                f"Recording stopped: {self._max_recording_duration}s buffer limit reached"
+            )
     
     @property
     def is_recording(self) -> bool:
@@ -127,4 +241,5 @@ class VoiceRecorder:
     def cleanup(self) -> None:
         """Clean up resources."""
         self._is_recording = False
-        self._cleanup_stream()
\ No newline at end of file
+        self._cleanup_stream()
+        self._unlock_buffer_pages(self._audio_buffer)
\ No newline at end of file
@@ -1,11 +1,20 @@
 import logging
-from typing import Dict, Callable, Set
-from threading import Lock
-
-import keyboard
+from typing import Dict, Callable, Optional, Tuple
 
 from utils.exceptions import HotkeyError
 
+_keyboard = None
+
+
+def _import_keyboard():
+    """Import the keyboard library on first use; it installs OS-level
+    hooks at import time, which delays app startup."""
+    global _keyboard
+    if _keyboard is None:
+        import keyboard
+        _keyboard = keyboard
+    return _keyboard
+
 
 class HotkeyManager:
     """Manages hotkey detection and callbacks."""
@@ -19,15 +28,29 @@ class HotkeyManager:
         self._logger = logging.getLogger(__name__)
         self._validate_hotkey_mappings(hotkey_mappings)
         
-        self._hotkey_mappings = hotkey_mappings
+        # Store hotkeys in canonical lowercase form once, rather than
+        # re-lowercasing on every hook registration
+        self._hotkey_mappings = {k.lower(): v for k, v in hotkey_mappings.items()}
         self._start_callback = start_callback
         self._stop_callback = stop_callback
-        
-        self._pressed_keys: Set[str] = set()
+
+        # Pressed state lives in a single int bitmask (one bit per prefix).
+        # Both edge handlers run on the keyboard library's event thread and
+        # int updates are atomic under the GIL, so no lock is needed. The
+        # dispatch table carries each prefix together with its bit, so
+        # update_hotkey_mappings publishes both with one reference swap and
+        # the handlers can never see a prefix from one table and a bit
+        # assignment from another.
+        self._scan_code_table: Dict[int, Tuple[str, int]] = {}
+        self._pressed_mask = 0
         self._is_running = False
-        self._key_lock = Lock()
-        self._hooks = []
+        self._master_hook: Optional[Callable] = None
         
+    @staticmethod
+    def _build_prefix_bits(mappings: Dict[str, str]) -> Dict[str, int]:
+        """Assign each prefix a bit in the pressed-state mask."""
+        return {prefix: 1 << index for index, prefix in enumerate(mappings.values())}
+
     def _validate_hotkey_mappings(self, mappings: Dict[str, str]) -> None:
         """Validate hotkey mappings."""
         if not mappings:
@@ -47,63 +70,87 @@ class HotkeyManager:
         """Start monitoring hotkeys."""
         self._is_running = True
 
-        for hotkey, prefix in self._hotkey_mappings.items():
-            press_hook = keyboard.on_press_key(
-                hotkey.lower(),
-                lambda e, p=prefix: self._on_key_down(p),
-                suppress=False
-            )
-            release_hook = keyboard.on_release_key(
-                hotkey.lower(),
-                lambda e, p=prefix: self._on_key_up(p),
-                suppress=False
-            )
-            self._hooks.extend([press_hook, release_hook])
+        # One global hook with a dict lookup per event, instead of a
+        # press/release hook pair per hotkey that the keyboard library
+        # would traverse on every keyboard event system-wide
+        self._scan_code_table = self._build_scan_code_table(self._hotkey_mappings)
+        self._master_hook = _import_keyboard().hook(self._dispatch)
 
         self._logger.info(f"Started keyboard monitoring for: {list(self._hotkey_mappings.keys())}")
-    
+
     def stop_monitoring(self) -> None:
         """Stop monitoring hotkeys and cleanup"""
         if not self._is_running:
             return
-        
-        self._is_running = False
 
-        for hook in self._hooks:
-            keyboard.unhook(hook)
+        self._is_running = False
 
-        self._hooks.clear()
+        if self._master_hook is not None:
+            _keyboard.unhook(self._master_hook)
+            self._master_hook = None
 
-        with self._key_lock:
-            self._pressed_keys.clear()
+        self._pressed_mask = 0
 
         self._logger.info("Stopped hotkey monitoring")
 
-    def _on_key_down(self, prefix: str) -> None:
+    def _build_scan_code_table(self, mappings: Dict[str, str]) -> Dict[int, Tuple[str, int]]:
+        """Resolve each hotkey name to its scan codes once, at bind time."""
+        keyboard = _import_keyboard()
+        prefix_bits = self._build_prefix_bits(mappings)
+        table = {}
+        for hotkey, prefix in mappings.items():
+            try:
+                for scan_code in keyboard.key_to_scan_codes(hotkey):
+                    table[scan_code] = (prefix, prefix_bits[prefix])
+            except ValueError:
+                raise HotkeyError(f"Unknown hotkey: {hotkey}")
+        return table
+
+    def _dispatch(self, event) -> None:
+        """Route a keyboard event to the press/release handler for its hotkey.
+
+        Matching on the precomputed scan code avoids per-event string
+        comparisons and is unaffected by Shift changing the reported name.
+        """
+        entry = self._scan_code_table.get(event.scan_code)
+        if entry is None:
+            return
+
+        prefix, bit = entry
+        if event.event_type == _keyboard.KEY_DOWN:
+            self._on_key_down(prefix, bit)
+        else:
+            self._on_key_up(prefix, bit)
+
+    def _on_key_down(self, prefix: str, bit: int) -> None:
         if not self._is_running:
             return
-        
-        with self._key_lock:
-            if prefix not in self._pressed_keys:
-                self._pressed_keys.add(prefix)
-                self._start_callback(prefix)
 
-    def _on_key_up(self, prefix: str) -> None:
+        if not self._pressed_mask & bit:
+            self._pressed_mask |= bit
+            self._start_callback(prefix)
+
+    def _on_key_up(self, prefix: str, bit: int) -> None:
         if not self._is_running:
             return
-        
-        with self._key_lock:
-            if prefix in self._pressed_keys:
-                self._pressed_keys.remove(prefix)
-                self._stop_callback(prefix)
+
+        if self._pressed_mask & bit:
+            self._pressed_mask &= ~bit
+            self._stop_callback(prefix)
     
     def update_hotkey_mappings(self, new_mappings: Dict[str, str]) -> None:
         """Update hotkey mappings."""
         self._validate_hotkey_mappings(new_mappings)
-        
-        with self._key_lock:
-            self._hotkey_mappings = new_mappings.copy()
-            self._pressed_keys.clear()
+
+        normalized = {k.lower(): v for k, v in new_mappings.items()}
+
+        # Build the table before publishing anything: if a hotkey name
+        # can't be resolved to scan codes this raises HotkeyError and the
+        # manager keeps dispatching its previous mappings unchanged
+        if self._is_running:
+            self._scan_code_table = self._build_scan_code_table(normalized)
+        self._hotkey_mappings = normalized
+        self._pressed_mask = 0
         
         self._logger.info(f"Updated hotkey mappings: {new_mappings}")
 
@@ -1,57 +1,96 @@
 import logging
+import threading
 import time
-import pyperclip
-from pynput.keyboard import Key, Controller
+from typing import ClassVar, Optional
 
-from config.constants import MINECRAFT_CHAT_KEY, ENTER_KEY_DELAY
+from config.constants import MINECRAFT_CHAT_KEY
 from utils.exceptions import MessageSendError
 
 
 class KeyboardController:
     """Handles keyboard input simulation."""
-    
+
+    # pynput's Controller wraps a process-global input mechanism and is
+    # thread-safe, so one instance is shared across all controllers
+    _shared_controller: ClassVar[Optional[object]] = None
+
     def __init__(self):
         self._logger = logging.getLogger(__name__)
-        self._controller = Controller()
+        # Imported here rather than at module load so the input bindings
+        # don't slow down app startup
+        from pynput.keyboard import Key, Controller
+        self._key = Key
+
+        if KeyboardController._shared_controller is None:
+            KeyboardController._shared_controller = Controller()
+        self._controller = KeyboardController._shared_controller
+        self._restore_lock = threading.Lock()
     
     def send_message_to_minecraft(self, message: str, auto_send: bool = True) -> None:
-        """Send a message to Minecraft chat using clipboard paste."""
+        """Send a message to Minecraft chat by typing it directly."""
         try:
-            original_clipboard = None
-            try:
-                original_clipboard = pyperclip.paste()
-            except:
-                # ignore if clipboard is empty or inaccesible
-                pass
-            
-            pyperclip.copy(message)
-            
             self.simulate_key_press(MINECRAFT_CHAT_KEY)
-            
-            self._controller.press(Key.ctrl)
-            time.sleep(0.05)
-            self._controller.press('v')
-            time.sleep(0.05)
-            self._controller.release('v')
-            time.sleep(0.05)
-            self._controller.release(Key.ctrl)
-            
+
+            if message.isascii():
+                # type() is synchronous, so no settling sleeps are needed
+                self._controller.type(message)
+            else:
+                # pynput can't type every character directly; fall back to
+                # clipboard paste for messages with non-ASCII content
+                self._paste_message(message)
+
             if auto_send:
-                self.simulate_key_press(Key.enter)
+                self.simulate_key_press(self._key.enter)
                 self._logger.info(f"Sent to Minecraft chat: '{message}'")
             else:
                 self._logger.info(f"Typed in Minecraft chat: '{message}' (manual send)")
-            
-            # restore clipboard to prev state after everything is done
-            if original_clipboard is not None:
-                time.sleep(0.15)
-                try:
-                    pyperclip.copy(original_clipboard)
-                except:
-                    pass
-                
+
         except Exception as error:
             raise MessageSendError(f"Failed to send message to Minecraft: {error}")
+
+    def _paste_message(self, message: str) -> None:
+        """Paste a message via the clipboard, restoring its previous contents."""
+        import pyperclip
+
+        original_clipboard = None
+        try:
+            original_clipboard = pyperclip.paste()
+        except:
+            # ignore if clipboard is empty or inaccesible
+            pass
+
+        pyperclip.copy(message)
+
+        # pressed() guarantees ordering of the modifier around the tap, so
+        # one settling sleep after the paste replaces the three in-between
+        with self._controller.pressed(self._key.ctrl):
+            self._controller.press('v')
+            self._controller.release('v')
+        time.sleep(0.05)
+
+        # restore clipboard to prev state after everything is done
+        if original_clipboard is not None:
+            self._schedule_clipboard_restore(original_clipboard)
+
+    def _schedule_clipboard_restore(self, contents: str) -> None:
+        """Restore the clipboard in the background instead of blocking the send.
+
+        If a restore is already pending, the new one is skipped so
+        rapid-fire sends don't stomp the original contents.
+        """
+        if not self._restore_lock.acquire(blocking=False):
+            return
+
+        def restore():
+            try:
+                import pyperclip
+                pyperclip.copy(contents)
+            except:
+                pass
+            finally:
+                self._restore_lock.release()
+
+        threading.Timer(0.15, restore).start()
     
     def simulate_key_press(self, key: str) -> None:
         """Simulate a key press."""
@@ -1,4 +1,4 @@
-import importlib
+import importlib.util
 from utils.exceptions import DependencyError
 
 
@@ -9,27 +9,27 @@ def check_dependencies() -> None:
         'numpy',
         'keyboard',
         'pynput',
+        'pyperclip',
         'customtkinter',
         'faster_whisper',
         'win32gui',
         'win32process',
         'psutil'
     ]
-    
+
     missing_modules = []
-    
+
     for module in required_modules:
-        try:
-            importlib.import_module(module)
-        except ImportError:
+        # find_spec confirms the module is installed without executing it,
+        # so the native bindings stay deferred until first use
+        if importlib.util.find_spec(module) is None:
             missing_modules.append(module)
-    
+
     if missing_modules:
         error_message = (
             f"Missing required modules: {', '.join(missing_modules)}\n"
             "Please install required packages:\n"
-            "pip install sounddevice numpy keyboard pynput customtkinter "
-            "faster-whisper pywin32 psutil"
+            "pip install sounddevice numpy keyboard pynput pyperclip "
+            "customtkinter faster-whisper pywin32 psutil"
         )
         raise DependencyError(error_message)
-